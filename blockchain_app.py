@@ -1,5 +1,5 @@
 import streamlit as st
-from blockchain_core import Blockchain
+from blockchain_core import Blockchain, format_timestamp
 import json
 
 # -----------------------------------------------------------------------------------
@@ -11,6 +11,9 @@ if "blockchain" not in st.session_state:
 
 blockchain = st.session_state.blockchain
 
+# Number of blocks shown per page in the "View Blockchain" action
+BLOCKS_PER_PAGE = 20
+
 # -----------------------------------------------------------------------------------
 # Configure the Streamlit web app layout and styling
 # -----------------------------------------------------------------------------------
@@ -72,11 +75,18 @@ if action == "Add Block":
 # -----------------------------------------------------------------------------------
 elif action == "View Blockchain":
     st.subheader("View Blockchain")
-    for block in blockchain.chain:
+
+    # Render one page of blocks per rerun instead of the whole chain
+    num_pages = (len(blockchain.chain) - 1) // BLOCKS_PER_PAGE + 1
+    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1, step=1)
+    st.caption(f"Page {page} of {num_pages} ({len(blockchain.chain)} blocks)")
+
+    start = (page - 1) * BLOCKS_PER_PAGE
+    for block in blockchain.chain[start:start + BLOCKS_PER_PAGE]:
         with st.expander(f"Block {block.header.index}"):
             st.json({
                 "Index": block.header.index,
-                "Timestamp": block.header.timestamp,
+                "Timestamp": format_timestamp(block.header.timestamp),
                 "Nonce": block.header.nonce,
                 "Previous Hash": block.header.previous_hash,
                 "Hash": block.header.hash,
@@ -92,12 +102,10 @@ elif action == "Search Blockchain":
     st.subheader("Search Blockchain")
     keyword = st.text_input("Enter keyword to search:")
     if st.button("Search"):
-        found = False
-        for block in blockchain.chain:
-            if keyword.lower() in str(block.data).lower():
-                st.success(f"Found in Block {block.header.index}: {block.data}")
-                found = True
-        if not found:
+        matches = blockchain.find_blocks(keyword)
+        for block in matches:
+            st.success(f"Found in Block {block.header.index}: {block.data}")
+        if not matches:
             st.error("Keyword not found in any block.")
 
 # -----------------------------------------------------------------------------------
@@ -136,5 +144,5 @@ elif action == "Save to File":
         st.success(f"Blockchain saved as '{filename}'.")
 
         # Optional: Provide a download button
-        with open(filename, "r") as f:
+        with open(filename, "rb") as f:
             st.download_button("Download File", f.read(), file_name=filename)
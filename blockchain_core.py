@@ -1,12 +1,147 @@
 import hashlib
+import hmac
+import multiprocessing
+import os
+import queue
+import struct
+import sys
 import time
+from collections import defaultdict
+from itertools import count, islice
 from datetime import datetime
-import json
+import orjson
 from colorama import init, Fore, Style
 
 # Initialize colorama to support colored console output (Windows and Unix)
 init(autoreset=True)
 
+# -----------------------------------------------------------------------------------
+# Helper Functions
+# -----------------------------------------------------------------------------------
+
+# Below this difficulty a block mines in tens of milliseconds, which is less than
+# the cost of starting worker processes, so mining stays in the calling process.
+PARALLEL_MIN_DIFFICULTY = 5
+
+# Number of nonces a worker tries between checks for another worker's success.
+POLL_INTERVAL = 4096
+
+# Seconds the parent waits for a result before checking that workers are still alive.
+RESULT_POLL_TIMEOUT = 0.1
+
+
+def search_nonce(prefix_ctx, difficulty, start=0, stop=None, step=1):
+    """
+    Scans nonces from `start` (every `step`-th one, up to `stop` if given) until
+    the hash of prefix + nonce, as an 8-byte little-endian integer, has
+    `difficulty` leading hex zeros. `prefix_ctx` is a SHA-256 object already fed
+    with the block prefix. Returns the winning nonce and its hex digest, or None
+    if the range is exhausted.
+    """
+    # Each leading hex zero is half a byte: compare whole zero bytes of the
+    # raw digest, plus the high nibble of the next byte for odd difficulties.
+    zero_bytes = b'\x00' * (difficulty // 2)
+    width = len(zero_bytes)
+    odd = difficulty & 1
+
+    # Bind the per-attempt lookups to locals once; this loop is the mining hot path.
+    copy = prefix_ctx.copy
+    nonces = count(start, step) if stop is None else range(start, stop, step)
+    for nonce in nonces:
+        ctx = copy()
+        ctx.update(nonce.to_bytes(8, 'little'))
+        raw = ctx.digest()
+        if raw[:width] == zero_bytes and (not odd or raw[width] < 0x10):
+            return nonce, ctx.hexdigest()
+    return None
+
+
+def pow_worker(prefix, difficulty, stride, offset, event, result_queue):
+    """
+    Worker process for parallel mining: searches nonces congruent to `offset`
+    modulo `stride` and reports the first hit on `result_queue`. Stops as soon
+    as `event` shows that another worker has already found one.
+    """
+    prefix_ctx = hashlib.sha256(prefix)
+    batch = stride * POLL_INTERVAL
+    for start in count(offset, batch):
+        if event.is_set():
+            return
+        found = search_nonce(prefix_ctx, difficulty, start, start + batch, stride)
+        if found is not None:
+            event.set()
+            result_queue.put(found)
+            return
+
+
+def parallel_search_nonce(prefix, difficulty, workers):
+    """
+    Splits the nonce space into `workers` interleaved stripes, mines them in
+    separate processes and returns the first nonce and hex digest found.
+    Falls back to searching in this process if every worker exits without a result.
+    """
+    event = multiprocessing.Event()
+    result_queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=pow_worker,
+            args=(prefix, difficulty, workers, offset, event, result_queue),
+            daemon=True,
+        )
+        for offset in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    result = None
+    while result is None:
+        try:
+            result = result_queue.get(timeout=RESULT_POLL_TIMEOUT)
+        except queue.Empty:
+            if any(process.is_alive() for process in processes):
+                continue
+            # Every worker has exited; take a result reported just before the last
+            # one finished, otherwise they all failed (e.g. a spawned child that
+            # could not bootstrap) and the block is mined in this process instead.
+            try:
+                result = result_queue.get(timeout=RESULT_POLL_TIMEOUT)
+            except queue.Empty:
+                result = search_nonce(hashlib.sha256(prefix), difficulty)
+
+    # The remaining workers may be mid-batch; stop them rather than wait.
+    event.set()
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+    result_queue.close()
+    return result
+
+
+def chain_digest(previous_digest, block_hash):
+    """
+    Extends a running chain digest with one block's hex hash:
+    H_i = SHA-256(H_{i-1} || hash_i), starting from an empty H_{-1}.
+    """
+    return hashlib.sha256(previous_digest + str(block_hash).encode()).digest()
+
+
+def trigrams(text):
+    """
+    Returns the set of three-character substrings of `text` used by the search index.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def format_timestamp(timestamp):
+    """
+    Converts a block's nanosecond timestamp into a readable local date and time.
+    """
+    # Integer math truncates to microseconds; dividing by 1e9 would round through a float
+    seconds = datetime.fromtimestamp(timestamp // 10**9)
+    return str(seconds.replace(microsecond=timestamp // 1000 % 10**6))
+
+
 # -----------------------------------------------------------------------------------
 # BlockHeader Class
 # -----------------------------------------------------------------------------------
@@ -16,6 +151,15 @@ class BlockHeader:
     Contains metadata for each block, similar to headers used in real-world blockchains.
     Stores the block index, timestamp, previous block hash, nonce, difficulty, and hash.
     """
+    # Fixed attribute layout: no per-instance __dict__ for every block in the chain
+    __slots__ = (
+        'index', 'timestamp', 'previous_hash', 'nonce', 'difficulty', 'hash',
+        '_dirty', '_hash_changed',
+    )
+
+    # Header fields that are part of the block's hash input
+    HASHED_FIELDS = frozenset(('index', 'timestamp', 'previous_hash', 'nonce'))
+
     def __init__(self, index, timestamp, previous_hash, difficulty):
         self.index = index
         self.timestamp = timestamp
@@ -24,6 +168,15 @@ class BlockHeader:
         self.difficulty = difficulty
         self.hash = None  # Final hash will be computed after mining
 
+    def __setattr__(self, name, value):
+        # Any change to a hashed field means the stored hash must be rechecked,
+        # and so does overwriting the stored hash itself
+        object.__setattr__(self, name, value)
+        if name in self.HASHED_FIELDS:
+            object.__setattr__(self, '_dirty', True)
+        elif name == 'hash':
+            object.__setattr__(self, '_hash_changed', True)
+
 
 # -----------------------------------------------------------------------------------
 # Block Class
@@ -34,36 +187,87 @@ class Block:
     Represents a complete block containing a header and the user-provided data.
     Mining is automatically triggered during initialization.
     """
+    __slots__ = ('header', '_data', 'mining_time', '_prefix', '_dirty')
+
     def __init__(self, index, data, previous_hash, difficulty):
-        timestamp = str(datetime.now())
+        timestamp = time.time_ns()  # Nanoseconds since the epoch; see format_timestamp()
         self.header = BlockHeader(index, timestamp, previous_hash, difficulty)
         self.data = data
+        self._prefix = self.hash_prefix()
         self.header.hash = self.mine_block()  # Begin mining when block is created
+        # Everything so far went into the mined hash; later changes mark the block dirty
+        self._dirty = False
+        self.header._dirty = False
+        self.header._hash_changed = False
+
+    @property
+    def data(self):
+        """
+        The user-provided block data. Assigning to it marks the block as modified.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._prefix = None  # Cached hash input no longer matches the data
+        self._dirty = True
+
+    def is_modified(self):
+        """
+        Returns True if the data, any hashed header field or the stored hash
+        changed after mining.
+        """
+        return self._dirty or self.header._dirty or self.header._hash_changed
+
+    def hash_prefix(self):
+        """
+        Returns the encoded block attributes that precede the nonce in the hash input.
+        The nonce itself is appended as an 8-byte little-endian integer.
+
+        Layout: index and timestamp as little-endian uint64, then the previous hash
+        and the data as UTF-8, each preceded by its uint32 length, so that
+        different field values can never encode to the same bytes.
+        """
+        previous_hash = self.header.previous_hash.encode()
+        data = str(self.data).encode()
+        return (
+            struct.pack('<QQI', self.header.index, self.header.timestamp, len(previous_hash))
+            + previous_hash
+            + struct.pack('<I', len(data))
+            + data
+        )
 
     def calculate_hash(self):
         """
         Generates a SHA-256 hash based on the block's attributes.
         """
-        content = (
-            f"{self.header.index}{self.header.timestamp}"
-            f"{self.data}{self.header.previous_hash}{self.header.nonce}"
-        )
-        return hashlib.sha256(content.encode()).hexdigest()
+        if self._prefix is None or self.header._dirty:
+            self._prefix = self.hash_prefix()
+        content = self._prefix + self.header.nonce.to_bytes(8, 'little')
+        return hashlib.sha256(content).hexdigest()
 
     def mine_block(self):
         """
         Proof-of-Work algorithm: iteratively searches for a nonce that produces
-        a hash with the required number of leading zeros.
+        a hash with the required number of leading zeros. Higher difficulties
+        are mined across all CPU cores.
         """
-        prefix = '0' * self.header.difficulty
         start_time = time.time()
-
-        while True:
-            hash_attempt = self.calculate_hash()
-            if hash_attempt.startswith(prefix):
-                self.mining_time = round(time.time() - start_time, 4)
-                return hash_attempt
-            self.header.nonce += 1
+        workers = os.cpu_count() or 1
+        if self.header.difficulty >= PARALLEL_MIN_DIFFICULTY and workers > 1:
+            self.header.nonce, hash_attempt = parallel_search_nonce(
+                self._prefix, self.header.difficulty, workers
+            )
+        else:
+            # Everything but the nonce is fixed while mining, so the SHA-256 state
+            # for that prefix is computed once and copied for each attempt.
+            prefix_ctx = hashlib.sha256(self._prefix)
+            self.header.nonce, hash_attempt = search_nonce(
+                prefix_ctx, self.header.difficulty, self.header.nonce
+            )
+        self.mining_time = round(time.time() - start_time, 4)
+        return hash_attempt
 
 
 # -----------------------------------------------------------------------------------
@@ -80,6 +284,11 @@ class Blockchain:
     def __init__(self, difficulty=2):
         self.difficulty = difficulty
         self.chain = [self.create_genesis_block()]  # Initialize with Genesis Block
+        # Search index: lowercased three-character substring -> indices of blocks containing it
+        self._index = defaultdict(set)
+        self.index_block(self.chain[0])
+        # Running digest over the stored block hashes as they were appended
+        self._cumhash = [chain_digest(b"", self.chain[0].header.hash)]
 
     def create_genesis_block(self):
         """
@@ -100,32 +309,122 @@ class Blockchain:
         """
         last_block = self.get_latest_block()
         new_block = Block(len(self.chain), data, last_block.header.hash, self.difficulty)
+        # Drop digests of blocks removed from the chain before extending it
+        del self._cumhash[len(self.chain):]
         self.chain.append(new_block)
+        self.index_block(new_block)
+        # Only extend while the digests still line up with the chain; blocks
+        # appended around add_block are rehashed on every validation instead.
+        if len(self._cumhash) == len(self.chain) - 1:
+            self._cumhash.append(chain_digest(self._cumhash[-1], new_block.header.hash))
+
+    def index_block(self, block):
+        """
+        Adds a block's data to the search index.
+        """
+        for gram in trigrams(str(block.data).lower()):
+            self._index[gram].add(block.header.index)
 
-    def is_chain_valid(self):
+    def unindex_block(self, block):
+        """
+        Removes a block's current data from the search index.
+        """
+        for gram in trigrams(str(block.data).lower()):
+            postings = self._index.get(gram)
+            if postings is not None:
+                postings.discard(block.header.index)
+                if not postings:
+                    del self._index[gram]
+
+    def find_blocks(self, keyword):
+        """
+        Returns the blocks whose data contains the keyword (case-insensitive).
+
+        Every block containing the keyword contains all of its trigrams, so for
+        keywords of three or more characters the candidates are the intersection
+        of those trigrams' index entries (cost roughly proportional to the
+        smallest entry), and only the candidates are checked with a substring
+        test. Shorter keywords have no trigrams and fall back to scanning every
+        block, O(blocks x data length).
+        """
+        keyword = keyword.lower()
+        grams = trigrams(keyword)
+        if not grams:
+            return [block for block in self.chain if keyword in str(block.data).lower()]
+
+        postings = sorted((self._index.get(gram, set()) for gram in grams), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return [
+            self.chain[i] for i in sorted(candidates)
+            if i < len(self.chain) and keyword in str(self.chain[i].data).lower()
+        ]
+
+    def is_chain_valid(self, verbose=False):
         """
         Validates the blockchain by checking:
         1. If the current block's stored hash matches the recalculated hash.
         2. If the previous_hash value matches the actual hash of the previous block.
+        Stops at the first invalid block. With verbose=True, the status of each
+        checked block is printed once validation finishes.
         """
+        first_changed = self._first_changed_block()
         valid = True
-        for i in range(1, len(self.chain)):
-            current = self.chain[i]
-            previous = self.chain[i - 1]
-
-            recalculated_hash = current.calculate_hash()
+        messages = []
+        # Walk adjacent (previous, current) pairs rather than indexing twice per block
+        pairs = zip(self.chain, islice(self.chain, 1, None))
+        for i, (previous, current) in enumerate(pairs, start=1):
+            # Untouched blocks still hold the hash they were mined with. Blocks whose
+            # data, hashed header fields or stored hash were assigned since mining,
+            # and blocks from the first one that breaks the running digest onward,
+            # are rehashed and compared.
+            # Comparing bytes keeps compare_digest from raising on a hash that was
+            # overwritten with None or non-ASCII text.
+            if current.is_modified() or i >= first_changed:
+                recalculated_hash = current.calculate_hash()
+                hash_ok = hmac.compare_digest(
+                    str(current.header.hash).encode(), recalculated_hash.encode()
+                )
+            else:
+                hash_ok = True
 
-            if current.header.hash != recalculated_hash:
-                print(Fore.RED + f"[Block {i}] Invalid hash! Stored: {current.header.hash}, Calculated: {recalculated_hash}")
+            if not hash_ok:
+                if verbose:
+                    messages.append(Fore.RED + f"[Block {i}] Invalid hash! Stored: {current.header.hash}, Calculated: {recalculated_hash}")
                 valid = False
+                break
             elif current.header.previous_hash != previous.header.hash:
-                print(Fore.RED + f"[Block {i}] Invalid previous hash! Stored: {current.header.previous_hash}, Expected: {previous.header.hash}")
+                if verbose:
+                    messages.append(Fore.RED + f"[Block {i}] Invalid previous hash! Stored: {current.header.previous_hash}, Expected: {previous.header.hash}")
                 valid = False
-            else:
-                print(Fore.GREEN + f"[Block {i}] Valid.")
+                break
+            elif verbose:
+                messages.append(Fore.GREEN + f"[Block {i}] Valid.")
 
+        # One write for the whole report instead of a print per block
+        if messages:
+            sys.stdout.write("\n".join(messages) + "\n")
         return valid
 
+    def _first_changed_block(self):
+        """
+        Returns the index of the first block whose stored hash no longer matches
+        the running digest recorded when it was added. Blocks past the recorded
+        digests (e.g. appended to self.chain directly) count as changed.
+
+        Hashing only happens when a block's stored hash was assigned after mining;
+        a clean chain costs one flag check per block.
+        """
+        common = min(len(self._cumhash), len(self.chain))
+        if not any(block.header._hash_changed for block in islice(self.chain, common)):
+            return common
+
+        digest = b""
+        for i, block in enumerate(islice(self.chain, common)):
+            digest = chain_digest(digest, block.header.hash)
+            if digest != self._cumhash[i]:
+                return i
+        return common
+
     def print_chain(self):
         """
         Prints the contents of the entire blockchain to the console in a readable format.
@@ -134,7 +433,7 @@ class Blockchain:
             print(Fore.CYAN + "-" * 50)
             print(Fore.YELLOW + "Block Header:")
             print(f"  Index         : {block.header.index}")
-            print(f"  Timestamp     : {block.header.timestamp}")
+            print(f"  Timestamp     : {format_timestamp(block.header.timestamp)}")
             print(f"  Nonce         : {block.header.nonce}")
             print(f"  Previous Hash : {block.header.previous_hash}")
             print(f"  Hash          : {block.header.hash}")
@@ -147,12 +446,10 @@ class Blockchain:
         """
         Searches all blocks in the chain for a keyword within the data field.
         """
-        found = False
-        for block in self.chain:
-            if keyword.lower() in str(block.data).lower():
-                print(Fore.GREEN + f"Found in Block {block.header.index}: {block.data}")
-                found = True
-        if not found:
+        matches = self.find_blocks(keyword)
+        for block in matches:
+            print(Fore.GREEN + f"Found in Block {block.header.index}: {block.data}")
+        if not matches:
             print(Fore.RED + "Keyword not found.")
 
     def tamper_block(self, index):
@@ -161,7 +458,10 @@ class Blockchain:
         This simulates tampering and should break chain validity.
         """
         if 0 < index < len(self.chain):
-            self.chain[index].data = "Tampered Data"
+            block = self.chain[index]
+            self.unindex_block(block)
+            block.data = "Tampered Data"
+            self.index_block(block)
             print(Fore.RED + f"Block {index} has been tampered.")
         else:
             print(Fore.YELLOW + "Cannot tamper Genesis block or out-of-range index.")
@@ -171,11 +471,10 @@ class Blockchain:
         Exports the entire blockchain to a local JSON file.
         Useful for analysis, backup, or reloading.
         """
-        chain_data = []
-        for block in self.chain:
-            block_info = {
+        chain_data = [
+            {
                 "index": block.header.index,
-                "timestamp": block.header.timestamp,
+                "timestamp": format_timestamp(block.header.timestamp),
                 "nonce": block.header.nonce,
                 "previous_hash": block.header.previous_hash,
                 "hash": block.header.hash,
@@ -183,8 +482,10 @@ class Blockchain:
                 "data": block.data,
                 "mining_time": getattr(block, "mining_time", "N/A")
             }
-            chain_data.append(block_info)
+            for block in self.chain
+        ]
 
-        with open(filename, "w") as f:
-            json.dump(chain_data, f, indent=4)
+        # orjson encodes in C and returns bytes, so the file is written in one call
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(chain_data, option=orjson.OPT_INDENT_2))
         print(Fore.GREEN + f"Blockchain saved to '{filename}'")
\ No newline at end of file
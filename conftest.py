@@ -0,0 +1,2 @@
+# Keeps the repository root importable when the suite is run with a bare `pytest`,
+# so tests can import blockchain_core without installing the project.
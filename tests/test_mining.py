@@ -0,0 +1,41 @@
+import hashlib
+
+import blockchain_core
+from blockchain_core import parallel_search_nonce
+
+PREFIX = b"toy-blockchain test prefix"
+
+
+def assert_valid_proof(nonce, digest, difficulty):
+    assert hashlib.sha256(PREFIX + nonce.to_bytes(8, "little")).hexdigest() == digest
+    assert digest.startswith("0" * difficulty)
+
+
+def test_parallel_search_returns_matching_nonce_and_digest():
+    nonce, digest = parallel_search_nonce(PREFIX, 3, 2)
+    assert_valid_proof(nonce, digest, 3)
+
+
+class UnstartableProcess:
+    """Stands in for a worker process that exits before reporting anything."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+    def is_alive(self):
+        return False
+
+    def terminate(self):
+        pass
+
+    def join(self):
+        pass
+
+
+def test_parallel_search_falls_back_when_no_worker_runs(monkeypatch):
+    monkeypatch.setattr(blockchain_core.multiprocessing, "Process", UnstartableProcess)
+    nonce, digest = parallel_search_nonce(PREFIX, 3, 2)
+    assert_valid_proof(nonce, digest, 3)
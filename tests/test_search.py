@@ -0,0 +1,37 @@
+from blockchain_core import Blockchain
+
+
+def make_chain(*data):
+    blockchain = Blockchain(difficulty=1)
+    for item in data:
+        blockchain.add_block(item)
+    return blockchain
+
+
+def indices(blocks):
+    return [block.header.index for block in blocks]
+
+
+def test_whole_word_keyword_also_matches_inside_longer_words():
+    blockchain = make_chain("cat", "concatenate the strings")
+    assert indices(blockchain.find_blocks("cat")) == [1, 2]
+    assert indices(blockchain.find_blocks("CAT")) == [1, 2]
+
+
+def test_keyword_spanning_words_falls_back_to_substring_scan():
+    blockchain = make_chain("tx 1 alice", "tx 12 bob", "tx 2 carol")
+    assert indices(blockchain.find_blocks("x 1")) == [1, 2]
+    assert indices(blockchain.find_blocks("")) == [0, 1, 2, 3]
+
+
+def test_tampered_block_is_searched_by_its_new_data():
+    blockchain = make_chain("alice pays bob")
+    blockchain.tamper_block(1)
+    assert blockchain.find_blocks("alice") == []
+    assert indices(blockchain.find_blocks("tamper")) == [1]
+
+
+def test_keyword_shorter_than_a_trigram_is_scanned():
+    blockchain = make_chain("ab", "xyz")
+    assert indices(blockchain.find_blocks("b")) == [0, 1]
+    assert indices(blockchain.find_blocks("yz")) == [2]
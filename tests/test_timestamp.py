@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from blockchain_core import format_timestamp
+
+
+def test_format_timestamp_truncates_instead_of_rounding():
+    # 999999.6 microseconds: dividing by 1e9 would round up into the next second
+    timestamp = 1_700_000_000_999_999_600
+    expected = datetime.fromtimestamp(1_700_000_000).replace(microsecond=999_999)
+    assert format_timestamp(timestamp) == str(expected)
@@ -0,0 +1,48 @@
+from blockchain_core import Blockchain
+
+
+def make_chain():
+    blockchain = Blockchain(difficulty=1)
+    for item in ("alice pays bob", "bob pays carol", "carol pays dave"):
+        blockchain.add_block(item)
+    return blockchain
+
+
+def test_clean_chain_is_valid():
+    assert make_chain().is_chain_valid() is True
+
+
+def test_editing_data_directly_is_detected():
+    blockchain = make_chain()
+    blockchain.chain[1].data = "alice pays mallory"
+    assert blockchain.is_chain_valid() is False
+
+
+def test_editing_a_hashed_header_field_is_detected():
+    blockchain = make_chain()
+    blockchain.chain[2].header.nonce += 1
+    assert blockchain.is_chain_valid() is False
+
+
+def test_overwriting_the_last_block_hash_is_detected():
+    blockchain = make_chain()
+    blockchain.chain[-1].header.hash = "0" * 64
+    assert blockchain.is_chain_valid() is False
+
+
+def test_hash_set_to_none_is_invalid_not_an_error():
+    blockchain = make_chain()
+    blockchain.chain[2].header.hash = None
+    assert blockchain.is_chain_valid() is False
+
+
+def test_non_ascii_hash_is_invalid_not_an_error():
+    blockchain = make_chain()
+    blockchain.chain[2].header.hash = "é" * 64
+    assert blockchain.is_chain_valid() is False
+
+
+def test_tamper_block_is_detected():
+    blockchain = make_chain()
+    blockchain.tamper_block(2)
+    assert blockchain.is_chain_valid() is False